@@ -2,18 +2,22 @@
 Cross-platform system volume control via DDJ-FLX4 channel fader.
 
 Deck 1 CH FADER  →  system output volume
-VU meters        ←  mirror current volume level
+VU meters        ←  mirror current volume level (updated on fader moves,
+                    plus external volume changes)
 
 Platform notes
 --------------
 macOS   : uses osascript  (built-in, no extra packages)
-Linux   : uses pactl      (PulseAudio; install: apt install pulseaudio-utils)
+Linux   : uses pulsectl   (if installed: pip install pulsectl)
+          or pactl        (PulseAudio; install: apt install pulseaudio-utils)
 Windows : uses pycaw      (install: pip install pycaw comtypes)
 
 Run with:  python examples/volume_control.py
 Stop with: Ctrl+C
 """
 
+import atexit
+import os
 import re
 import subprocess
 import sys
@@ -22,11 +26,19 @@ import time
 
 import flx4py
 
+try:
+    import pulsectl  # type: ignore[import]
+except ImportError:
+    pulsectl = None
+
 
 # ---------------------------------------------------------------------------
 # Cross-platform volume helpers
 # ---------------------------------------------------------------------------
 
+_VOLUME_RE = re.compile(r"(\d+)%")
+
+
 def _get_volume_macos() -> float:
     r = subprocess.run(
         ["osascript", "-e", "output volume of (get volume settings)"],
@@ -35,11 +47,20 @@ def _get_volume_macos() -> float:
     return int(r.stdout.strip()) / 100.0
 
 
+_osascript = None
+
+
 def _set_volume_macos(level: float) -> None:
-    subprocess.run(
-        ["osascript", "-e", f"set volume output volume {int(level * 100)}"],
-        check=False,
-    )
+    # Fader moves arrive in bursts, so keep one interpreter running and feed
+    # it commands instead of launching osascript for every event.
+    global _osascript
+    if _osascript is None or _osascript.poll() is not None:
+        _osascript = subprocess.Popen(
+            ["osascript", "-i"],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True,
+        )
+    _osascript.stdin.write(f"set volume output volume {int(level * 100)}\n")
+    _osascript.stdin.flush()
 
 
 def _get_volume_linux() -> float:
@@ -47,7 +68,7 @@ def _get_volume_linux() -> float:
         ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
         capture_output=True, text=True,
     )
-    m = re.search(r"(\d+)%", r.stdout)
+    m = _VOLUME_RE.search(r.stdout)
     return int(m.group(1)) / 100.0 if m else 0.5
 
 
@@ -58,45 +79,128 @@ def _set_volume_linux(level: float) -> None:
     )
 
 
-def _get_volume_windows() -> float:
-    try:
-        from ctypes import POINTER, cast
-        from comtypes import CLSCTX_ALL  # type: ignore[import]
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume  # type: ignore[import]
+_volume_iface = None
+
+
+def _get_volume_iface():
+    # Activating the endpoint is a full COM round-trip — do it only once.
+    global _volume_iface
+    if _volume_iface is None:
+        try:
+            from ctypes import POINTER, cast
+            from comtypes import CLSCTX_ALL  # type: ignore[import]
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume  # type: ignore[import]
+        except ImportError:
+            raise RuntimeError(
+                "pycaw is required on Windows: pip install pycaw comtypes"
+            )
         devices = AudioUtilities.GetSpeakers()
         interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(interface, POINTER(IAudioEndpointVolume))
-        return float(volume.GetMasterVolumeLevelScalar())
-    except ImportError:
-        raise RuntimeError(
-            "pycaw is required on Windows: pip install pycaw comtypes"
-        )
+        _volume_iface = cast(interface, POINTER(IAudioEndpointVolume))
+    return _volume_iface
+
+
+def _get_volume_windows() -> float:
+    return float(_get_volume_iface().GetMasterVolumeLevelScalar())
 
 
 def _set_volume_windows(level: float) -> None:
+    _get_volume_iface().SetMasterVolumeLevelScalar(level, None)
+
+
+_pulse = None
+_pulse_lock = threading.Lock()
+
+
+def _get_pulse():
+    # One persistent connection to the sound server instead of a pactl per call.
+    global _pulse
+    if _pulse is None:
+        _pulse = pulsectl.Pulse("flx4py")
+    return _pulse
+
+
+def _get_volume_pulsectl() -> float:
+    with _pulse_lock:
+        pulse = _get_pulse()
+        sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+        return sink.volume.value_flat
+
+
+def _set_volume_pulsectl(level: float) -> None:
+    with _pulse_lock:
+        pulse = _get_pulse()
+        sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+        pulse.volume_set_all_chans(sink, level)
+
+
+def _volume_changes_pulsectl():
+    # Listening blocks the connection, so it gets its own.
+    with pulsectl.Pulse("flx4py-events") as pulse:
+        events = []
+
+        def on_event(event) -> None:
+            events.append(event)
+            raise pulsectl.PulseLoopStop
+
+        pulse.event_mask_set("sink")
+        pulse.event_callback_set(on_event)
+        while True:
+            pulse.event_listen()
+            # Swallow the rest of a burst, so it costs a single readback.
+            while True:
+                seen = len(events)
+                pulse.event_listen(timeout=0.02)
+                if len(events) == seen:
+                    break
+            events.clear()
+            yield
+
+
+def _volume_changes_polling():
+    # No change notifications available — re-check once per second.
+    while True:
+        time.sleep(1.0)
+        yield
+
+
+def _volume_changes_linux():
+    # Blocks until PulseAudio/PipeWire reports a sink change.
+    proc = subprocess.Popen(["pactl", "subscribe"], stdout=subprocess.PIPE)
+    atexit.register(proc.terminate)
     try:
-        from ctypes import POINTER, cast
-        from comtypes import CLSCTX_ALL  # type: ignore[import]
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume  # type: ignore[import]
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(interface, POINTER(IAudioEndpointVolume))
-        volume.SetMasterVolumeLevelScalar(level, None)
-    except ImportError:
-        raise RuntimeError(
-            "pycaw is required on Windows: pip install pycaw comtypes"
-        )
+        fd = proc.stdout.fileno()
+        pending = b""
+        while True:
+            # Each read returns everything queued so far, so a burst of
+            # events costs a single readback.
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return
+            *lines, pending = (pending + chunk).split(b"\n")
+            if any(b"on sink #" in line for line in lines):
+                yield
+    finally:
+        proc.terminate()
+        proc.wait()
 
 
 if sys.platform == "darwin":
     get_volume = _get_volume_macos
     set_volume = _set_volume_macos
+    volume_changes = _volume_changes_polling
 elif sys.platform == "win32":
     get_volume = _get_volume_windows
     set_volume = _set_volume_windows
+    volume_changes = _volume_changes_polling
+elif pulsectl is not None:
+    get_volume = _get_volume_pulsectl
+    set_volume = _set_volume_pulsectl
+    volume_changes = _volume_changes_pulsectl
 else:
     get_volume = _get_volume_linux
     set_volume = _set_volume_linux
+    volume_changes = _volume_changes_linux
 
 
 # ---------------------------------------------------------------------------
@@ -106,17 +210,30 @@ else:
 controller = flx4py.DDJFlx4()
 
 
+# Sink events this soon after a fader move are our own set_volume echoing back.
+_ECHO_WINDOW = 0.5
+_last_local_set = 0.0
+
+
+def show_volume(vol: float) -> None:
+    controller.leds.set_level_meters(vol, vol)
+
+
 @controller.on_knob("CH_FADER", deck=1)
 def fader_moved(event: flx4py.KnobEvent) -> None:
+    global _last_local_set
+    _last_local_set = time.monotonic()
     set_volume(event.value)
+    show_volume(event.value)
 
 
 def meter_loop() -> None:
-    while True:
-        vol = get_volume()
-        controller.leds.set_level_meter(1, vol)
-        controller.leds.set_level_meter(2, vol)
-        time.sleep(0.05)
+    # Only picks up volume changes made outside the controller.
+    show_volume(get_volume())
+    for _ in volume_changes():
+        if time.monotonic() - _last_local_set < _ECHO_WINDOW:
+            continue
+        show_volume(get_volume())
 
 
 with controller:
@@ -2,10 +2,12 @@
 Main DDJ-FLX4 controller class.
 """
 
-import time
+import logging
+import queue
 import threading
-import traceback
-from collections import defaultdict
+import time
+from dataclasses import fields
+from operator import attrgetter
 from typing import Callable
 
 import mido
@@ -30,14 +32,68 @@ from .mappings import (
     KNOB_7BIT_INPUT,
     PAD_INPUT,
     TAB_INPUT,
+    ButtonInfo,
+    JogInfo,
+    KnobInfo,
 )
 
 
+_log = logging.getLogger(__name__)
+
+# Minimum seconds between repeated log entries for the same failing callback.
+_ERROR_LOG_INTERVAL = 1.0
+
+
 def _find_port(names: list[str], keyword: str) -> str | None:
-    for name in names:
-        if keyword in name:
-            return name
-    return None
+    return next((name for name in names if keyword in name), None)
+
+
+def _make_predicate(filters: dict) -> Callable | None:
+    """Compile *filters* into a single attribute compare; ``None`` matches everything."""
+    filters = {k: v for k, v in filters.items() if v is not None}
+    if not filters:
+        return None
+    get = attrgetter(*filters)
+    want = next(iter(filters.values())) if len(filters) == 1 else tuple(filters.values())
+    return lambda event: get(event) == want
+
+
+def _coalescing(matches: Callable | None) -> Callable:
+    """Wrap a knob predicate so it rejects events that repeat the last value it accepted."""
+    last: dict[tuple[str, int | None], float] = {}
+
+    def predicate(event: KnobEvent) -> bool:
+        if matches is not None and not matches(event):
+            return False
+        key = (event.name, event.deck)
+        if last.get(key) == event.value:
+            return False
+        last[key] = event.value
+        return True
+
+    return predicate
+
+
+def _flatten(table: dict[tuple[int, int], tuple[Callable, object]]) -> list:
+    """Spread a ``(channel, number)`` keyed table into a 16 * 128 list."""
+    flat: list = [None] * (16 * 128)
+    for (channel, number), entry in table.items():
+        flat[(channel << 7) | number] = entry
+    return flat
+
+
+def _recycler(cls: type) -> Callable:
+    """Return a constructor for event class *cls* that refills one shared instance."""
+    instance = object.__new__(cls)
+    slots = tuple(f.name for f in fields(cls))
+    setattr_ = object.__setattr__
+
+    def make(*values):
+        for slot, value in zip(slots, values):
+            setattr_(instance, slot, value)
+        return instance
+
+    return make
 
 
 class DDJFlx4:
@@ -50,6 +106,18 @@ class DDJFlx4:
     Args:
         keyword: Substring used to locate the controller's MIDI ports.
                  Defaults to ``'FLX4'``.
+        reuse_events: Refill one shared :class:`JogEvent` / :class:`KnobEvent`
+                      for every jog and knob message instead of allocating a
+                      new one. Only enable this if no callback keeps a
+                      reference to those events after it returns.
+        dispatch_thread: Run callbacks on a dedicated thread fed through a
+                         queue, rather than on the MIDI backend's input
+                         thread, so slow callbacks never hold up the backend.
+                         If callbacks fall behind, queued knob and fader
+                         moves are collapsed to the latest value of each.
+        led_rate_limit: Output budget for :attr:`leds` in bytes per second;
+                        see :class:`LEDController`. ``None`` (the default)
+                        means no limit.
 
     Raises:
         RuntimeError: If no matching input or output port is found.
@@ -68,60 +136,130 @@ class DDJFlx4:
         controller.start()
     """
 
-    def __init__(self, keyword: str = 'FLX4') -> None:
-        in_name = _find_port(mido.get_input_names(), keyword)
-        out_name = _find_port(mido.get_output_names(), keyword)
+    def __init__(
+        self,
+        keyword: str = 'FLX4',
+        *,
+        reuse_events: bool = False,
+        dispatch_thread: bool = False,
+        led_rate_limit: float | None = None,
+    ) -> None:
+        in_names = mido.get_input_names()
+        out_names = mido.get_output_names()
+        in_name = _find_port(in_names, keyword)
+        out_name = _find_port(out_names, keyword)
 
         if in_name is None:
             raise RuntimeError(
                 f"No MIDI input port matching '{keyword}' found. "
-                f"Available: {mido.get_input_names()}"
+                f"Available: {in_names}"
             )
         if out_name is None:
             raise RuntimeError(
                 f"No MIDI output port matching '{keyword}' found. "
-                f"Available: {mido.get_output_names()}"
+                f"Available: {out_names}"
             )
 
         self._input = mido.open_input(in_name)
         self._output = mido.open_output(out_name)
 
-        self.leds = LEDController(self._output)
+        self.leds = LEDController(self._output, led_rate_limit)
         """LED controller. Use this to set pads, buttons, and VU meters."""
 
-        self._callbacks: dict[str, list[tuple[Callable, dict]]] = defaultdict(list)
+        # Copy-on-write: registration swaps in a new tuple under the lock,
+        # dispatch reads the current tuple without locking.
+        self._callbacks: dict[str, tuple[tuple[Callable, Callable | None], ...]] = {
+            event_type: ()
+            for event_type in ('pad', 'tab', 'button', 'knob', 'jog', 'jog_touch', 'browse', 'any')
+        }
         self._lock = threading.Lock()
-        self._control_state: dict[str, dict] = {}  # 14-bit MSB/LSB buffers
+        # Last 14-bit MSB per (channel << 7) | control; the LSB completes the pair.
+        self._msb = bytearray(16 * 128)
         self._values: dict[tuple[str, int | None], float] = {}
+        self._error_times: dict[tuple[int, type], float] = {}
         self._running = False
+
+        # With dispatch_thread, the backend callback only enqueues; None wakes the thread to stop.
+        self._queue: queue.SimpleQueue[mido.Message | None] | None = (
+            queue.SimpleQueue() if dispatch_thread else None
+        )
+        self._stopping = threading.Event()
         self._thread: threading.Thread | None = None
 
+        self._jog_event = _recycler(JogEvent) if reuse_events else JogEvent
+        self._knob_event = _recycler(KnobEvent) if reuse_events else KnobEvent
+
+        # (channel, note/control) -> (handler, mapping info), so each message
+        # costs a single lookup. Later entries win on overlapping addresses.
+        note_table: dict[tuple[int, int], tuple[Callable, object]] = {
+            **{key: (self._handle_button, info) for key, info in BUTTON_INPUT.items()},
+            **{key: (self._handle_jog_touch, deck) for key, deck in JOG_TOUCH_INPUT.items()},
+            **{key: (self._handle_tab, info) for key, info in TAB_INPUT.items()},
+            **{key: (self._handle_pad, info) for key, info in PAD_INPUT.items()},
+        }
+        cc_table: dict[tuple[int, int], tuple[Callable, object]] = {
+            **{
+                key: (self._handle_knob_7bit, (info, (info.name, info.deck)))
+                for key, info in KNOB_7BIT_INPUT.items()
+            },
+            **{
+                key: (self._handle_knob_lsb, (info, (info.name, info.deck), (msb_key[0] << 7) | msb_key[1]))
+                for key, msb_key in KNOB_14BIT_LSB.items()
+                for info in (KNOB_14BIT_INPUT[msb_key],)
+            },
+            **{key: (self._handle_knob_msb, (key[0] << 7) | key[1]) for key in KNOB_14BIT_INPUT},
+            **{key: (self._handle_browse, shifted) for key, shifted in BROWSE_INPUT.items()},
+            **{key: (self._handle_jog, info) for key, info in JOG_INPUT.items()},
+        }
+        # Flattened to lists indexed by (channel << 7) | number.
+        self._note_table = _flatten(note_table)
+        self._cc_table = _flatten(cc_table)
+        # CC slots carrying an absolute knob position (7-bit values and 14-bit
+        # LSBs), where a queued backlog only needs the latest message.
+        self._knob_slots = frozenset(
+            (channel << 7) | control
+            for (channel, control), (handler, _) in cc_table.items()
+            if handler == self._handle_knob_7bit or handler == self._handle_knob_lsb
+        )
+
     # ------------------------------------------------------------------
     # Connection lifecycle
     # ------------------------------------------------------------------
 
     def start(self) -> None:
         """
-        Start the background MIDI listener thread.
+        Start listening for MIDI messages.
 
         After calling this, registered callbacks will fire whenever the
-        controller sends a message. Safe to call only once.
+        controller sends a message. Messages are delivered by the MIDI
+        backend's own input thread (or the dispatch thread, if enabled), so
+        there is no polling. Safe to call only once.
         """
         if self._running:
             return
         self._running = True
-        self._thread = threading.Thread(target=self._loop, daemon=True, name='flx4py-listener')
+        if self._queue is None:
+            self._input.callback = self._on_message
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._dispatch_loop, name='flx4py-dispatch', daemon=True)
         self._thread.start()
+        self._input.callback = self._queue.put
 
     def stop(self) -> None:
         """
-        Stop the background listener thread and close MIDI ports.
+        Stop listening and close MIDI ports.
 
         The :class:`LEDController` is unusable after calling this.
         """
         self._running = False
+        self._input.callback = None
         if self._thread is not None:
-            self._thread.join(timeout=2.0)
+            self._stopping.set()
+            self._queue.put(None)
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
         self._input.close()
         self._output.close()
 
@@ -157,13 +295,23 @@ class DDJFlx4:
     # Callback registration
     # ------------------------------------------------------------------
 
-    def _register(self, event_type: str, func: Callable, filters: dict) -> None:
+    def _register(self, event_type: str, func: Callable, filters: dict, coalesce: bool = False) -> None:
+        matches = _make_predicate(filters)
+        if coalesce:
+            matches = _coalescing(matches)
+        entry = (func, matches)
         with self._lock:
-            self._callbacks[event_type].append((func, {k: v for k, v in filters.items() if v is not None}))
+            self._callbacks[event_type] += (entry,)
 
-    def _make_decorator(self, event_type: str, filters: dict, callback: Callable | None):
+    def _make_decorator(
+        self,
+        event_type: str,
+        filters: dict,
+        callback: Callable | None,
+        coalesce: bool = False,
+    ):
         def decorator(func: Callable) -> Callable:
-            self._register(event_type, func, filters)
+            self._register(event_type, func, filters, coalesce)
             return func
         if callback is not None:
             decorator(callback)
@@ -250,6 +398,7 @@ class DDJFlx4:
         name: str | None = None,
         deck: int | None = None,
         *,
+        coalesce: bool = False,
         callback: Callable | None = None,
     ):
         """
@@ -263,6 +412,8 @@ class DDJFlx4:
             name: Control name to filter on, e.g. ``'CH_FADER'``,
                   ``'CROSSFADER'``, ``'EQ_HI'``. ``None`` matches all.
             deck: Filter to a specific deck; ``None`` matches all.
+            coalesce: Skip events whose value is identical to the last one
+                      this callback received for the same control.
             callback: Register directly instead of using as decorator.
 
         Example::
@@ -271,7 +422,7 @@ class DDJFlx4:
             def crossfader(event: KnobEvent):
                 print(f"Crossfader: {event.value:.2f}")
         """
-        return self._make_decorator('knob', {'name': name, 'deck': deck}, callback)
+        return self._make_decorator('knob', {'name': name, 'deck': deck}, callback, coalesce)
 
     def on_jog(
         self,
@@ -346,7 +497,7 @@ class DDJFlx4:
             The callback unchanged (so it can be used as a decorator).
         """
         with self._lock:
-            self._callbacks['any'].append((callback, {}))
+            self._callbacks['any'] += ((callback, None),)
         return callback
 
     # ------------------------------------------------------------------
@@ -354,114 +505,139 @@ class DDJFlx4:
     # ------------------------------------------------------------------
 
     def _dispatch(self, event_type: str, event) -> None:
-        with self._lock:
-            typed = list(self._callbacks[event_type])
-            any_cbs = list(self._callbacks['any'])
+        typed = self._callbacks[event_type]
+        any_cbs = self._callbacks['any']
 
-        for func, filters in typed:
-            if all(getattr(event, k, None) == v for k, v in filters.items()):
+        for func, matches in typed:
+            if matches is None or matches(event):
                 try:
                     func(event)
-                except Exception:
-                    traceback.print_exc()
+                except Exception as exc:
+                    self._log_callback_error(func, exc)
 
         for func, _ in any_cbs:
             try:
                 func(event)
-            except Exception:
-                traceback.print_exc()
+            except Exception as exc:
+                self._log_callback_error(func, exc)
+
+    def _log_callback_error(self, func: Callable, exc: Exception) -> None:
+        # A callback that fails on every jog tick would otherwise flood the
+        # log, so repeats of the same error are dropped for a short while.
+        key = (id(func), type(exc))
+        now = time.monotonic()
+        last = self._error_times.get(key)
+        if last is not None and now - last < _ERROR_LOG_INTERVAL:
+            return
+        self._error_times[key] = now
+        _log.error("Callback %r raised an exception", func, exc_info=exc)
 
     # ------------------------------------------------------------------
     # MIDI listener
     # ------------------------------------------------------------------
 
-    def _loop(self) -> None:
-        while self._running:
-            for msg in self._input.iter_pending():
-                try:
-                    self._handle(msg)
-                except Exception:
-                    traceback.print_exc()
-            time.sleep(0.001)
+    def _on_message(self, msg: mido.Message) -> None:
+        try:
+            self._handle(msg)
+        except Exception:
+            _log.exception("Failed to handle MIDI message %s", msg)
+
+    def _dispatch_loop(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        on_message = self._on_message
+        stopping = self._stopping
+        while not stopping.is_set():
+            # Block for one message, then take everything else already queued.
+            batch = [get()]
+            try:
+                while True:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            if len(batch) > 1:
+                batch = self._latest_knob_values(batch)
+            for msg in batch:
+                if stopping.is_set():
+                    return
+                if msg is not None:
+                    on_message(msg)
+
+    def _latest_knob_values(self, batch: list[mido.Message | None]) -> list[mido.Message | None]:
+        # Drop knob messages superseded later in the batch. Notes, relative
+        # controls (jog, browse) and 14-bit MSBs all pass through in order, so
+        # each surviving LSB still pairs with the MSB sent just before it.
+        knob_slots = self._knob_slots
+        seen: set[int] = set()
+        kept = []
+        for msg in reversed(batch):
+            if msg is not None and msg.type == 'control_change':
+                slot = (msg.channel << 7) | msg.control
+                if slot in knob_slots:
+                    if slot in seen:
+                        continue
+                    seen.add(slot)
+            kept.append(msg)
+        kept.reverse()
+        return kept
 
     def _handle(self, msg: mido.Message) -> None:
-        if msg.type == 'note_on':
-            self._handle_note(msg)
-        elif msg.type == 'control_change':
-            self._handle_cc(msg)
-
-    def _handle_note(self, msg: mido.Message) -> None:
-        pressed = msg.velocity > 0
-        key = (msg.channel, msg.note)
-
-        if key in PAD_INPUT:
-            deck, pad = PAD_INPUT[key]
-            self._dispatch('pad', PadEvent(deck=deck, pad=pad, pressed=pressed, velocity=msg.velocity))
-
-        elif key in TAB_INPUT:
-            deck, tab = TAB_INPUT[key]
-            self._dispatch('tab', TabEvent(deck=deck, tab=tab, pressed=pressed))
-
-        elif key in JOG_TOUCH_INPUT:
-            deck = JOG_TOUCH_INPUT[key]
-            self._dispatch('jog_touch', JogTouchEvent(deck=deck, touched=pressed))
-
-        elif key in BUTTON_INPUT:
-            info = BUTTON_INPUT[key]
-            self._dispatch('button', ButtonEvent(
-                name=info.name, deck=info.deck, shifted=info.shifted, pressed=pressed,
-            ))
-
-    def _handle_cc(self, msg: mido.Message) -> None:
-        key = (msg.channel, msg.control)
-
-        if key in JOG_INPUT:
-            info = JOG_INPUT[key]
-            raw = msg.value
-            direction = +1 if raw > 64 else -1
-            velocity = abs(raw - 64)
-            self._dispatch('jog', JogEvent(deck=info.deck, surface=info.surface, direction=direction, velocity=velocity))
-
-        elif key in BROWSE_INPUT:
-            shifted = BROWSE_INPUT[key]
-            raw = msg.value
-            if 1 <= raw <= 64:
-                steps = raw
-            else:
-                steps = -(128 - raw)
-            self._dispatch('browse', BrowseEvent(steps=steps, shifted=shifted))
-
-        elif key in KNOB_14BIT_INPUT:
-            # MSB of a 14-bit control
-            info = KNOB_14BIT_INPUT[key]
-            state_key = f"{msg.channel}_{info.name}"
-            if state_key not in self._control_state:
-                self._control_state[state_key] = {'msb': 0, 'lsb': 0, 'info': info}
-            self._control_state[state_key]['msb'] = msg.value
-
-        elif key in KNOB_14BIT_LSB:
-            # LSB of a 14-bit control — fire event on LSB (complete pair)
-            msb_key = KNOB_14BIT_LSB[key]
-            info = KNOB_14BIT_INPUT[msb_key]
-            state_key = f"{msg.channel}_{info.name}"
-            if state_key not in self._control_state:
-                self._control_state[state_key] = {'msb': 0, 'lsb': 0, 'info': info}
-            self._control_state[state_key]['lsb'] = msg.value
-
-            msb = self._control_state[state_key]['msb']
-            lsb = self._control_state[state_key]['lsb']
-            raw = (msb << 7) | lsb
-
-            if info.name == 'TEMPO':
-                value = max(-1.0, min(1.0, (raw - 8192) / 8192.0))
-            else:
-                value = raw / 16383.0
-
-            self._values[(info.name, info.deck)] = value
-            self._dispatch('knob', KnobEvent(name=info.name, deck=info.deck, value=value, raw=raw))
-
-        elif key in KNOB_7BIT_INPUT:
-            info = KNOB_7BIT_INPUT[key]
-            value = msg.value / 127.0
-            self._values[(info.name, info.deck)] = value
-            self._dispatch('knob', KnobEvent(name=info.name, deck=info.deck, value=value, raw=msg.value))
+        # Handlers get the data byte that varies (velocity or value) instead
+        # of the message, so each mido attribute is read exactly once.
+        msg_type = msg.type
+        if msg_type == 'note_on':
+            entry = self._note_table[(msg.channel << 7) | msg.note]
+            if entry is not None:
+                handler, info = entry
+                handler(msg.velocity, info)
+        elif msg_type == 'control_change':
+            entry = self._cc_table[(msg.channel << 7) | msg.control]
+            if entry is not None:
+                handler, info = entry
+                handler(msg.value, info)
+
+    def _handle_pad(self, velocity: int, info: tuple[int, int]) -> None:
+        deck, pad = info
+        self._dispatch('pad', PadEvent(deck=deck, pad=pad, pressed=velocity > 0, velocity=velocity))
+
+    def _handle_tab(self, velocity: int, info: tuple[int, int]) -> None:
+        deck, tab = info
+        self._dispatch('tab', TabEvent(deck=deck, tab=tab, pressed=velocity > 0))
+
+    def _handle_jog_touch(self, velocity: int, deck: int) -> None:
+        self._dispatch('jog_touch', JogTouchEvent(deck=deck, touched=velocity > 0))
+
+    def _handle_button(self, velocity: int, info: ButtonInfo) -> None:
+        self._dispatch('button', ButtonEvent(
+            name=info.name, deck=info.deck, shifted=info.shifted, pressed=velocity > 0,
+        ))
+
+    def _handle_jog(self, raw: int, info: JogInfo) -> None:
+        direction = +1 if raw > 64 else -1
+        velocity = abs(raw - 64)
+        self._dispatch('jog', self._jog_event(info.deck, info.surface, direction, velocity))
+
+    def _handle_browse(self, raw: int, shifted: bool) -> None:
+        if 1 <= raw <= 64:
+            steps = raw
+        else:
+            steps = -(128 - raw)
+        self._dispatch('browse', BrowseEvent(steps=steps, shifted=shifted))
+
+    def _handle_knob_msb(self, value: int, msb_index: int) -> None:
+        # MSB of a 14-bit control
+        self._msb[msb_index] = value
+
+    def _handle_knob_lsb(self, lsb: int, entry: tuple[KnobInfo, tuple, int]) -> None:
+        # LSB of a 14-bit control — fire event on LSB (complete pair)
+        info, values_key, msb_index = entry
+        raw = (self._msb[msb_index] << 7) | lsb
+        value = info.normalize(raw)
+        self._values[values_key] = value
+        self._dispatch('knob', self._knob_event(info.name, info.deck, value, raw))
+
+    def _handle_knob_7bit(self, raw: int, entry: tuple[KnobInfo, tuple]) -> None:
+        info, values_key = entry
+        value = info.normalize(raw)
+        self._values[values_key] = value
+        self._dispatch('knob', self._knob_event(info.name, info.deck, value, raw))
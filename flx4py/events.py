@@ -2,14 +2,16 @@
 Event dataclasses emitted by the DDJFlx4 controller.
 
 Each event type corresponds to a physical interaction with the controller.
-All events are dispatched to registered callbacks in the background listener
-thread, so keep callbacks fast or offload heavy work to another thread.
+All events are dispatched to registered callbacks on the MIDI backend's input
+thread, or on a dedicated dispatch thread when the controller is created with
+``dispatch_thread=True``. Keep callbacks fast or offload heavy work to another
+thread.
 """
 
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PadEvent:
     """A performance pad was pressed or released."""
     deck: int
@@ -22,7 +24,7 @@ class PadEvent:
     """Raw MIDI velocity (0–127)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TabEvent:
     """A pad-mode tab key (HOT CUE / PAD FX / BEAT JUMP / SAMPLER) was pressed or released."""
     deck: int
@@ -33,7 +35,7 @@ class TabEvent:
     """``True`` on press, ``False`` on release."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonEvent:
     """A named button was pressed or released."""
     name: str
@@ -46,7 +48,7 @@ class ButtonEvent:
     """``True`` on press, ``False`` on release."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KnobEvent:
     """An absolute knob or fader changed value.
 
@@ -67,7 +69,7 @@ class KnobEvent:
     """Raw 14-bit (0–16383) or 7-bit (0–127) MIDI value before normalisation."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JogEvent:
     """The jog wheel was rotated."""
     deck: int
@@ -80,7 +82,7 @@ class JogEvent:
     """Magnitude of the turn (number of encoder steps, usually 1)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JogTouchEvent:
     """The jog wheel platter was touched or released."""
     deck: int
@@ -89,7 +91,7 @@ class JogTouchEvent:
     """``True`` when touched, ``False`` when released."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrowseEvent:
     """The browse encoder was rotated."""
     steps: int
@@ -5,17 +5,35 @@ The ``LEDController`` class provides methods to set individual LEDs and run
 built-in animations on the pads, buttons, and VU meters.
 """
 
+import asyncio
+import inspect
+import random
+import sys
+import threading
 import time
+from collections import deque
+from contextlib import closing
 from enum import Enum
-from typing import Any
+from typing import Any, Generator, Iterable, Sequence
 
 import mido
 
 from .mappings import (
     BUTTON_LED,
     LEVEL_METER_CC,
-    PAD_LED_CHANNELS,
     PAD_LED_MODES,
+    PAD_LED_TABLE,
+    TAB_LED_NOTES,
+)
+
+
+# Raw 3-byte MIDI messages: (status, data1, data2)
+Packet = tuple[int, int, int]
+
+# Prebuilt VU meter packets: _METER_PACKETS[deck - 1][value]
+_METER_PACKETS: tuple[tuple[Packet, ...], ...] = tuple(
+    tuple((0xB0 | channel, LEVEL_METER_CC, value) for value in range(128))
+    for channel in (0, 1)
 )
 
 
@@ -37,6 +55,156 @@ class PadMode(str, Enum):
     KEY_SHIFT = 'KEY_SHIFT'
 
 
+# (off, on) packet pairs laid out like PAD_LED_TABLE; see LEDController._fast_pad
+_PAD_PACKETS: tuple[tuple[Packet, Packet], ...] = tuple(
+    ((0x90 | channel, note, LEDState.OFF.value), (0x90 | channel, note, LEDState.ON.value))
+    for channel, note in PAD_LED_TABLE
+)
+
+# _TAB_PACKETS[deck - 1][tab] -> (off packet, on packet) for set_tab()
+_TAB_PACKETS: tuple[tuple[tuple[Packet, Packet], ...], ...] = tuple(
+    tuple(
+        ((0x90 | channel, note, LEDState.OFF.value), (0x90 | channel, note, LEDState.ON.value))
+        for note in TAB_LED_NOTES
+    )
+    for channel in (0, 1)
+)
+
+# (name, deck, shifted) -> (off packet, on packet) for set_button()
+_BUTTON_PACKETS: dict[tuple[str, int | None, bool], tuple[Packet, Packet]] = {
+    key: ((0x90 | channel, note, LEDState.OFF.value), (0x90 | channel, note, LEDState.ON.value))
+    for key, (channel, note) in BUTTON_LED.items()
+}
+
+# Everything all_off() turns off, in one precomputed stream
+_ALL_OFF_PACKETS: tuple[Packet, ...] = tuple(dict.fromkeys([
+    *(meters[0] for meters in _METER_PACKETS),
+    *(off for off, _ in _PAD_PACKETS),
+    *(off for tabs in _TAB_PACKETS for off, _ in tabs),
+    *(off for off, _ in _BUTTON_PACKETS.values()),
+]))
+
+
+def _hot_cue_pair(deck_idx: int, pad: int) -> tuple[Packet, Packet]:
+    # Unshifted HOT_CUE pad, i.e. _fast_pad(deck_idx, 0, 0, pad, ...) as a pair.
+    return _PAD_PACKETS[(deck_idx << 7) | pad]
+
+
+def _hot_cue(deck_idx: int, pad: int, on: bool) -> Packet:
+    return _hot_cue_pair(deck_idx, pad)[on]
+
+
+# (off, on) packets for the hot cue pads and buttons animate_sparkle() may light
+_SPARKLE_PAD_PACKETS: tuple[tuple[Packet, Packet], ...] = tuple(
+    _hot_cue_pair(deck_idx, pad) for deck_idx in (0, 1) for pad in range(8)
+)
+_SPARKLE_BUTTON_PACKETS: tuple[tuple[Packet, Packet], ...] = tuple(
+    _BUTTON_PACKETS[(name, deck, False)]
+    for name in ('PLAY_PAUSE', 'CUE', 'BEAT_SYNC')
+    for deck in (1, 2)
+)
+
+_MODE_INDEX: dict[str, int] = {mode: i for i, mode in enumerate(PAD_LED_MODES)}
+
+# Seconds before an animation deadline to stop sleeping and spin instead.
+# Only Windows needs it: its sleep() is too coarse for frame timing. Animation
+# deadlines are kept on time.perf_counter(), which is fine-grained everywhere.
+_SLEEP_SPIN = 0.002 if sys.platform == 'win32' else 0.0
+
+# Steps per half breath in animate_breathing
+_BREATH_STEPS = 40
+
+# Built-in animations animate_async() can run; defaults come from the animate_* signatures
+_ANIMATIONS = frozenset({'wave', 'knight_rider', 'breathing', 'ping_pong', 'sparkle', 'rainbow_chase'})
+
+
+def _loop_deltas(frames: Sequence[tuple[Packet, ...]]) -> list[tuple[Packet, ...]]:
+    """Reduce a looping animation's frames to the packets that change an LED."""
+    # Start from the state the LEDs are in after one full pass.
+    state = {(status, data1): data2 for frame in frames for status, data1, data2 in frame}
+    deltas = []
+    for frame in frames:
+        changed = tuple(packet for packet in frame if state[packet[0], packet[1]] != packet[2])
+        for status, data1, data2 in changed:
+            state[status, data1] = data2
+        deltas.append(changed)
+    return deltas
+
+
+def _breathing_interval(cycle: float) -> float:
+    # Seconds per step for a breath of cycle seconds.
+    return cycle / (_BREATH_STEPS * 2)
+
+
+def _breathing_frame(phase: int) -> tuple[Packet, ...]:
+    t = phase / _BREATH_STEPS
+    level = t if t <= 1.0 else 2.0 - t
+    num_pads = int(level * 8)
+    meter = int(level * 127)
+    return (
+        _METER_PACKETS[0][meter],
+        _METER_PACKETS[1][meter],
+        *(_hot_cue(deck_idx, pad, pad < num_pads) for deck_idx in (0, 1) for pad in range(8)),
+    )
+
+
+def _ping_pong_frame(step: int) -> tuple[Packet, ...]:
+    leg, i = divmod(step, 8)
+    if leg == 0:
+        # Along deck 1, with its meter rising.
+        return (*(_hot_cue(0, j, j == i) for j in range(8)), _METER_PACKETS[0][int(i / 7 * 127)])
+    if leg == 1:
+        # Along deck 2, with the meters crossing over.
+        return (
+            *(packet for j in range(8) for packet in (_hot_cue(0, j, False), _hot_cue(1, j, j == i))),
+            _METER_PACKETS[0][int((1.0 - i / 7) * 127)],
+            _METER_PACKETS[1][int(i / 7 * 127)],
+        )
+    # Back along deck 2, with its meter falling.
+    i = 7 - i
+    return (*(_hot_cue(1, j, j == i) for j in range(8)), _METER_PACKETS[1][int(i / 7 * 127)])
+
+
+# Looping animations are rendered once at import: every full frame, plus the
+# per-step deltas that are sent once the first pass has set every LED.
+_WAVE_FRAMES: tuple[tuple[Packet, ...], ...] = tuple(
+    tuple(_hot_cue(deck_idx, i, i == pos) for deck_idx in (0, 1) for i in range(8))
+    for pos in range(8)
+)
+_WAVE_DELTAS = tuple(_loop_deltas(_WAVE_FRAMES))
+
+# One full knight rider bounce: 0..7 then back down to 1
+_KNIGHT_RIDER_FRAMES: tuple[tuple[Packet, ...], ...] = tuple(
+    (
+        *(_hot_cue(deck_idx, j, j == pos) for deck_idx in (0, 1) for j in range(8)),
+        _METER_PACKETS[0][int(pos / 7 * 127)],
+        _METER_PACKETS[1][int(pos / 7 * 127)],
+    )
+    for pos in (*range(8), *range(6, 0, -1))
+)
+_KNIGHT_RIDER_DELTAS = tuple(_loop_deltas(_KNIGHT_RIDER_FRAMES))
+
+_BREATHING_FRAMES: tuple[tuple[Packet, ...], ...] = tuple(
+    _breathing_frame(phase) for phase in range(_BREATH_STEPS * 2)
+)
+_BREATHING_DELTAS = tuple(_loop_deltas(_BREATHING_FRAMES))
+
+# Rainbow chase: a four-pad window sliding along both decks, deck 2 four pads ahead,
+# with the meters swinging in opposite directions.
+_RAINBOW_CHASE_FRAMES: tuple[tuple[Packet, ...], ...] = tuple(
+    (
+        *(_hot_cue(deck_idx, i, (i + offset + deck_idx * 4) % 16 < 4) for deck_idx in (0, 1) for i in range(8)),
+        _METER_PACKETS[0][int(abs(8 - offset) / 8 * 127)],
+        _METER_PACKETS[1][int((1.0 - abs(8 - offset) / 8) * 127)],
+    )
+    for offset in range(16)
+)
+_RAINBOW_CHASE_DELTAS = tuple(_loop_deltas(_RAINBOW_CHASE_FRAMES))
+
+_PING_PONG_FRAMES: tuple[tuple[Packet, ...], ...] = tuple(_ping_pong_frame(step) for step in range(24))
+_PING_PONG_DELTAS = tuple(_loop_deltas(_PING_PONG_FRAMES))
+
+
 class LEDController:
     """
     Controls all LEDs on the DDJ-FLX4 over MIDI.
@@ -46,20 +214,122 @@ class LEDController:
 
     Args:
         output: An open ``mido`` output port connected to the controller.
+        rate_limit: Optional output budget in bytes per second (3125 is DIN
+                    MIDI speed). When set, animations hold back frames while
+                    recent output is over it. ``None`` (the default) sends
+                    every frame.
     """
 
-    def __init__(self, output: Any) -> None:
+    def __init__(self, output: Any, rate_limit: float | None = None) -> None:
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
         self._out = output
+        # Last data2 sent per (status, data1), indexed by _slot(); 0xFF = unknown.
+        self._sent = bytearray(b'\xff' * 8192)
+        # Seconds of budget each 3-byte packet uses up; 0.0 = unlimited.
+        self._packet_time = 3 / rate_limit if rate_limit else 0.0
+        # When everything sent so far is paid off at the rate limit.
+        self._busy_until = 0.0
+
+        rt = getattr(output, '_rt', None)
+        if rt is not None and hasattr(rt, 'send_message'):
+            # rtmidi backend: write raw bytes, sharing the port's send lock.
+            self._raw = rt.send_message
+            self._lock = getattr(output, '_send_lock', None) or threading.RLock()
+        else:
+            # Other ports need mido.Message objects; build each distinct one once.
+            messages: dict[Packet, mido.Message] = {}
+
+            def raw(packet: Packet) -> None:
+                msg = messages.get(packet)
+                if msg is None:
+                    msg = messages[packet] = mido.Message.from_bytes(packet)
+                output.send(msg)
+
+            self._raw = raw
+            self._lock = threading.RLock()
 
     # ------------------------------------------------------------------
     # Low-level helpers
     # ------------------------------------------------------------------
 
-    def _note(self, channel: int, note: int, velocity: int) -> None:
-        self._out.send(mido.Message('note_on', channel=channel, note=note, velocity=velocity))
-
-    def _cc(self, channel: int, control: int, value: int) -> None:
-        self._out.send(mido.Message('control_change', channel=channel, control=control, value=value))
+    def _meter(self, index: int, value: int) -> None:
+        self._send_bulk((_METER_PACKETS[index][value],))
+
+    def _send_bulk(self, packets: Iterable[Packet]) -> None:
+        # One lock acquisition and no mido.Message objects for a whole frame.
+        # Packets that would not change what an LED already shows are dropped.
+        raw = self._raw
+        sent = self._sent
+        count = 0
+        with self._lock:
+            for packet in packets:
+                status, data1, data2 = packet
+                slot = ((status & 0x7F) << 7) | data1
+                if sent[slot] != data2:
+                    sent[slot] = data2
+                    raw(packet)
+                    count += 1
+            if count and self._packet_time:
+                self._busy_until = max(self._busy_until, time.monotonic()) + count * self._packet_time
+
+    def _backlog(self) -> float:
+        # Seconds of sent data not yet paid off at the rate limit.
+        return self._busy_until - time.monotonic()
+
+    def _send_frame(self, frame: Iterable[Packet], held: dict[tuple[int, int], Packet], budget: float) -> None:
+        # While output is more than budget seconds over the rate limit, merge the
+        # frame into held instead of sending it; the next frame that goes out
+        # carries the latest state of every LED touched in between.
+        if self._backlog() > budget:
+            held.update(((packet[0], packet[1]), packet) for packet in frame)
+            return
+        if held:
+            held.update(((packet[0], packet[1]), packet) for packet in frame)
+            frame = tuple(held.values())
+            held.clear()
+        if frame:
+            self._send_bulk(frame)
+
+    def _pad_packet(
+        self,
+        deck: int,
+        pad: int,
+        on: bool,
+        mode: str | PadMode = PadMode.HOT_CUE,
+        shifted: bool = False,
+    ) -> Packet:
+        if deck not in (1, 2):
+            raise ValueError("deck must be 1 or 2")
+        if not 0 <= pad <= 7:
+            raise ValueError("pad must be 0–7")
+        # PadMode members are str, so they hash and compare equal to the plain names.
+        mode_idx = _MODE_INDEX.get(mode)
+        if mode_idx is None:
+            raise ValueError(f"unknown mode '{mode}'")
+        return self._fast_pad(deck - 1, int(shifted), mode_idx, pad, 1 if on else 0)
+
+    @staticmethod
+    def _fast_pad(deck_idx: int, shifted_idx: int, mode_idx: int, pad: int, on: bool) -> Packet:
+        # Unvalidated: all indices are zero-based and must already be in range.
+        return _PAD_PACKETS[(((deck_idx << 1) | shifted_idx) << 6) | (mode_idx << 3) | pad][on]
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> None:
+        # Animations advance an absolute time.perf_counter() deadline each
+        # frame, so time spent sending and sleep overshoot do not accumulate
+        # as drift.
+        delay = deadline - time.perf_counter()
+        if delay <= 0:
+            return
+        if not _SLEEP_SPIN:
+            time.sleep(delay)
+            return
+        # Sleep short of the deadline, then spin on the same clock.
+        if delay > _SLEEP_SPIN:
+            time.sleep(delay - _SLEEP_SPIN)
+        while time.perf_counter() < deadline:
+            pass
 
     # ------------------------------------------------------------------
     # Performance pads
@@ -86,18 +356,7 @@ class LEDController:
         Raises:
             ValueError: If *deck*, *pad*, or *mode* is invalid.
         """
-        if deck not in (1, 2):
-            raise ValueError("deck must be 1 or 2")
-        if not 0 <= pad <= 7:
-            raise ValueError("pad must be 0–7")
-        mode_str = PadMode(mode).value if isinstance(mode, str) else mode.value
-        if mode_str not in PAD_LED_MODES:
-            raise ValueError(f"unknown mode '{mode_str}'")
-
-        normal_ch, shifted_ch = PAD_LED_CHANNELS[deck]
-        channel = shifted_ch if shifted else normal_ch
-        note = PAD_LED_MODES[mode_str] + pad
-        self._note(channel, note, LEDState.ON.value if on else LEDState.OFF.value)
+        self._send_bulk((self._pad_packet(deck, pad, on, mode, shifted),))
 
     def set_all_pads(
         self,
@@ -107,13 +366,20 @@ class LEDController:
         shifted: bool = False,
     ) -> None:
         """Set all 8 pads on *deck* to the same state."""
-        for i in range(8):
-            self.set_pad(deck, i, on, mode, shifted)
+        self._send_bulk(self._row_packets(deck, on, mode, shifted))
 
     def clear_pads(self, deck: int, mode: str | PadMode = PadMode.HOT_CUE) -> None:
         """Turn off all pads on *deck* in *mode* (both normal and shifted)."""
-        self.set_all_pads(deck, False, mode, shifted=False)
-        self.set_all_pads(deck, False, mode, shifted=True)
+        self._send_bulk(
+            self._row_packets(deck, False, mode, False) + self._row_packets(deck, False, mode, True)
+        )
+
+    def _row_packets(self, deck: int, on: bool, mode: str | PadMode, shifted: bool) -> tuple[Packet, ...]:
+        # Validate deck and mode once, then fill in the row unchecked.
+        self._pad_packet(deck, 0, on, mode, shifted)
+        mode_idx = _MODE_INDEX[mode]
+        on_idx = 1 if on else 0
+        return tuple(self._fast_pad(deck - 1, int(shifted), mode_idx, pad, on_idx) for pad in range(8))
 
     # ------------------------------------------------------------------
     # Deck buttons
@@ -139,11 +405,10 @@ class LEDController:
         Raises:
             ValueError: If the button name / deck combination is not found.
         """
-        key = (name, deck, shifted)
-        if key not in BUTTON_LED:
+        packets = _BUTTON_PACKETS.get((name, deck, shifted))
+        if packets is None:
             raise ValueError(f"unknown button '{name}' with deck={deck}, shifted={shifted}")
-        channel, note = BUTTON_LED[key]
-        self._note(channel, note, LEDState.ON.value if on else LEDState.OFF.value)
+        self._send_bulk((packets[1] if on else packets[0],))
 
     def set_tab(self, deck: int, tab: int, on: bool) -> None:
         """
@@ -154,11 +419,9 @@ class LEDController:
             tab: Tab index 0–3 (HOT CUE, PAD FX, BEAT JUMP, SAMPLER).
             on: ``True`` to light, ``False`` to turn off.
         """
-        tab_notes = {0: 27, 1: 30, 2: 32, 3: 34}
-        if tab not in tab_notes:
+        if tab not in range(4):
             raise ValueError("tab must be 0–3")
-        channel = 0 if deck == 1 else 1
-        self._note(channel, tab_notes[tab], LEDState.ON.value if on else LEDState.OFF.value)
+        self._send_bulk((_TAB_PACKETS[0 if deck == 1 else 1][int(tab)][1 if on else 0],))
 
     # ------------------------------------------------------------------
     # VU level meters
@@ -180,8 +443,22 @@ class LEDController:
             raise ValueError("deck must be 1 or 2")
         if not 0.0 <= level <= 1.0:
             raise ValueError("level must be 0.0–1.0")
-        channel = 0 if deck == 1 else 1
-        self._cc(channel, LEVEL_METER_CC, int(level * 127))
+        self._meter(deck - 1, int(level * 127))
+
+    def set_level_meters(self, level_1: float, level_2: float) -> None:
+        """
+        Set both channel VU meters at once using normalised values.
+
+        Args:
+            level_1: Deck 1 level, 0.0 (off) to 1.0 (peak / red).
+            level_2: Deck 2 level, 0.0 (off) to 1.0 (peak / red).
+
+        Raises:
+            ValueError: If either level is out of range.
+        """
+        if not (0.0 <= level_1 <= 1.0 and 0.0 <= level_2 <= 1.0):
+            raise ValueError("level must be 0.0–1.0")
+        self._send_bulk((_METER_PACKETS[0][int(level_1 * 127)], _METER_PACKETS[1][int(level_2 * 127)]))
 
     def set_level_meter_raw(self, deck: int, value: int) -> None:
         """
@@ -195,27 +472,38 @@ class LEDController:
             raise ValueError("deck must be 1 or 2")
         if not 0 <= value <= 127:
             raise ValueError("value must be 0–127")
-        channel = 0 if deck == 1 else 1
-        self._cc(channel, LEVEL_METER_CC, value)
+        self._meter(deck - 1, value)
 
     # ------------------------------------------------------------------
     # Utility
     # ------------------------------------------------------------------
 
+    def invalidate_cache(self) -> None:
+        """
+        Forget which LED states have already been sent.
+
+        Updates that would not change an LED are normally skipped. Call this
+        if the controller's LEDs may have changed without going through this
+        object (for example after the device was power-cycled), so the next
+        update to every LED is sent again.
+        """
+        with self._lock:
+            self._sent[:] = b'\xff' * len(self._sent)
+
+    def has_pending_messages(self) -> bool:
+        """
+        Return ``True`` if recent LED updates are over the ``rate_limit``.
+
+        This does not measure the USB link: sent updates are charged against
+        the budget given as ``rate_limit``. Always ``False`` when no rate
+        limit is set.
+        """
+        return self._backlog() > 0
+
     def all_off(self) -> None:
         """Turn off every controllable LED on the controller."""
-        for deck in (1, 2):
-            self.set_level_meter(deck, 0.0)
-            for mode in PAD_LED_MODES:
-                self.clear_pads(deck, mode)
-            for tab in range(4):
-                self.set_tab(deck, tab, False)
-
-        seen: set[tuple[int, int]] = set()
-        for ch, note in BUTTON_LED.values():
-            if (ch, note) not in seen:
-                self._note(ch, note, 0)
-                seen.add((ch, note))
+        self.invalidate_cache()
+        self._send_bulk(_ALL_OFF_PACKETS)
 
     # ------------------------------------------------------------------
     # Built-in animations
@@ -229,15 +517,7 @@ class LEDController:
             duration: Seconds to run.
             speed: Seconds between steps.
         """
-        end = time.monotonic() + duration
-        pos = 0
-        while time.monotonic() < end:
-            for deck in (1, 2):
-                for i in range(8):
-                    self.set_pad(deck, i, i == pos % 8)
-            pos += 1
-            time.sleep(speed)
-        self.all_off()
+        self._play(self._wave_frames(), duration, speed)
 
     def animate_knight_rider(self, duration: float = 10.0, speed: float = 0.05) -> None:
         """
@@ -247,29 +527,7 @@ class LEDController:
             duration: Seconds to run.
             speed: Seconds between steps.
         """
-        end = time.monotonic() + duration
-        while time.monotonic() < end:
-            for i in range(8):
-                if time.monotonic() >= end:
-                    break
-                for deck in (1, 2):
-                    for j in range(8):
-                        self.set_pad(deck, j, j == i)
-                level = i / 7
-                self.set_level_meter(1, level)
-                self.set_level_meter(2, level)
-                time.sleep(speed)
-            for i in range(6, 0, -1):
-                if time.monotonic() >= end:
-                    break
-                for deck in (1, 2):
-                    for j in range(8):
-                        self.set_pad(deck, j, j == i)
-                level = i / 7
-                self.set_level_meter(1, level)
-                self.set_level_meter(2, level)
-                time.sleep(speed)
-        self.all_off()
+        self._play(self._knight_rider_frames(), duration, speed)
 
     def animate_breathing(self, duration: float = 10.0, cycle: float = 2.0) -> None:
         """
@@ -279,23 +537,7 @@ class LEDController:
             duration: Seconds to run.
             cycle: Duration of one full breath cycle in seconds.
         """
-        end = time.monotonic() + duration
-        steps = 40
-        delay = cycle / (steps * 2)
-        while time.monotonic() < end:
-            for phase in range(steps * 2):
-                if time.monotonic() >= end:
-                    break
-                t = phase / steps
-                level = t if t <= 1.0 else 2.0 - t
-                num_pads = int(level * 8)
-                self.set_level_meter(1, level)
-                self.set_level_meter(2, level)
-                for deck in (1, 2):
-                    for p in range(8):
-                        self.set_pad(deck, p, p < num_pads)
-                time.sleep(delay)
-        self.all_off()
+        self._play(self._breathing_frames(), duration, _breathing_interval(cycle))
 
     def animate_ping_pong(self, duration: float = 10.0, speed: float = 0.05) -> None:
         """
@@ -305,34 +547,7 @@ class LEDController:
             duration: Seconds to run.
             speed: Seconds between steps.
         """
-        end = time.monotonic() + duration
-        while time.monotonic() < end:
-            for i in range(8):
-                if time.monotonic() >= end:
-                    break
-                for j in range(8):
-                    self.set_pad(1, j, j == i)
-                self.set_level_meter(1, i / 7)
-                time.sleep(speed)
-            for i in range(8):
-                if time.monotonic() >= end:
-                    break
-                for j in range(8):
-                    self.set_pad(1, j, False)
-                    self.set_pad(2, j, j == i)
-                self.set_level_meter(1, 1.0 - i / 7)
-                self.set_level_meter(2, i / 7)
-                time.sleep(speed)
-            for i in range(7, -1, -1):
-                if time.monotonic() >= end:
-                    break
-                for j in range(8):
-                    self.set_pad(2, j, j == i)
-                self.set_level_meter(2, i / 7)
-                time.sleep(speed)
-            self.set_level_meter(1, 0.0)
-            self.set_level_meter(2, 0.0)
-        self.all_off()
+        self._play(self._ping_pong_frames(), duration, speed)
 
     def animate_sparkle(self, duration: float = 10.0, speed: float = 0.08) -> None:
         """
@@ -342,50 +557,7 @@ class LEDController:
             duration: Seconds to run.
             speed: Seconds between each change.
         """
-        import random
-        end = time.monotonic() + duration
-        active: list[tuple] = []
-
-        deck_buttons = [
-            ('PLAY_PAUSE', 1), ('PLAY_PAUSE', 2),
-            ('CUE', 1), ('CUE', 2),
-            ('BEAT_SYNC', 1), ('BEAT_SYNC', 2),
-        ]
-
-        while time.monotonic() < end:
-            deck = random.choice((1, 2))
-            pad = random.randint(0, 7)
-            self.set_pad(deck, pad, True)
-            active.append(('pad', deck, pad))
-
-            if random.random() > 0.65:
-                btn, btn_deck = random.choice(deck_buttons)
-                try:
-                    self.set_button(btn, True, btn_deck)
-                    active.append(('btn', btn_deck, btn))
-                except Exception:
-                    pass
-
-            while len(active) > 10:
-                item = active.pop(0)
-                if item[0] == 'pad':
-                    self.set_pad(item[1], item[2], False)
-                else:
-                    try:
-                        self.set_button(item[2], False, item[1])
-                    except Exception:
-                        pass
-
-            time.sleep(speed)
-
-        for item in active:
-            if item[0] == 'pad':
-                self.set_pad(item[1], item[2], False)
-            else:
-                try:
-                    self.set_button(item[2], False, item[1])
-                except Exception:
-                    pass
+        self._play(self._sparkle_frames(), duration, speed)
 
     def animate_rainbow_chase(self, duration: float = 10.0, speed: float = 0.08) -> None:
         """
@@ -395,16 +567,138 @@ class LEDController:
             duration: Seconds to run.
             speed: Seconds between steps.
         """
-        end = time.monotonic() + duration
-        offset = 0
-        while time.monotonic() < end:
-            for deck in (1, 2):
-                for i in range(8):
-                    pos = (i + offset + (deck - 1) * 4) % 16
-                    self.set_pad(deck, i, pos < 4)
-            meter = abs(8 - (offset % 16)) / 8
-            self.set_level_meter(1, meter)
-            self.set_level_meter(2, 1.0 - meter)
-            offset += 1
-            time.sleep(speed)
-        self.all_off()
+        self._play(self._rainbow_chase_frames(), duration, speed)
+
+    async def animate_async(self, name: str, duration: float = 10.0, **options: float) -> None:
+        """
+        Run a built-in animation without blocking the event loop.
+
+        Args:
+            name: Animation name: ``'wave'``, ``'knight_rider'``, ``'breathing'``,
+                  ``'ping_pong'``, ``'sparkle'`` or ``'rainbow_chase'``.
+            duration: Seconds to run.
+            **options: ``speed`` (or ``cycle`` for ``'breathing'``), as accepted
+                  by the matching ``animate_*`` method.
+
+        Raises:
+            ValueError: If the animation name is not known.
+            TypeError: If an option is not accepted by the animation.
+        """
+        if name not in _ANIMATIONS:
+            raise ValueError(f"unknown animation '{name}'")
+        # Bind against the blocking method, so both share its defaults and options.
+        args = inspect.signature(getattr(self, f'animate_{name}')).bind(duration, **options)
+        args.apply_defaults()
+        if name == 'breathing':
+            interval = _breathing_interval(args.arguments['cycle'])
+        else:
+            interval = args.arguments['speed']
+        frames = getattr(self, f'_{name}_frames')()
+        await self._play_async(frames, duration, interval)
+
+    # ------------------------------------------------------------------
+    # Animation drivers and frame generators
+    # ------------------------------------------------------------------
+    #
+    # Each _*_frames generator yields one frame of packets per step, forever,
+    # and restores the LEDs when it is closed. The drivers own the timing.
+
+    def _play(self, frames: Generator[Iterable[Packet], None, None], duration: float, interval: float) -> None:
+        sleep_until = self._sleep_until
+        with closing(self._steps(frames, duration, interval)) as deadlines:
+            for deadline in deadlines:
+                sleep_until(deadline)
+
+    async def _play_async(
+        self,
+        frames: Generator[Iterable[Packet], None, None],
+        duration: float,
+        interval: float,
+    ) -> None:
+        clock = time.perf_counter
+        with closing(self._steps(frames, duration, interval)) as deadlines:
+            for deadline in deadlines:
+                await asyncio.sleep(max(0.0, deadline - clock()))
+
+    def _steps(
+        self,
+        frames: Generator[Iterable[Packet], None, None],
+        duration: float,
+        interval: float,
+    ) -> Generator[float, None, None]:
+        # Yields each frame's perf_counter() deadline; the frame is sent once
+        # the driver has waited for it and resumes the generator.
+        send_frame = self._send_frame
+        held: dict[tuple[int, int], Packet] = {}
+        clock = time.perf_counter
+        tick = clock()
+        end = tick + duration
+        try:
+            # Render each frame ahead of its deadline, so only the send happens on time.
+            frame = next(frames)
+            while True:
+                yield tick
+                send_frame(frame, held, interval)
+                tick += interval
+                if tick >= end or clock() >= end:
+                    break
+                frame = next(frames)
+        finally:
+            if held:
+                self._send_bulk(tuple(held.values()))
+            frames.close()
+
+    def _loop(
+        self,
+        frames: tuple[tuple[Packet, ...], ...],
+        deltas: tuple[tuple[Packet, ...], ...],
+    ) -> Generator[tuple[Packet, ...], None, None]:
+        try:
+            yield from frames
+            while True:
+                yield from deltas
+        finally:
+            self.all_off()
+
+    def _wave_frames(self) -> Generator[tuple[Packet, ...], None, None]:
+        return self._loop(_WAVE_FRAMES, _WAVE_DELTAS)
+
+    def _knight_rider_frames(self) -> Generator[tuple[Packet, ...], None, None]:
+        return self._loop(_KNIGHT_RIDER_FRAMES, _KNIGHT_RIDER_DELTAS)
+
+    def _breathing_frames(self) -> Generator[tuple[Packet, ...], None, None]:
+        return self._loop(_BREATHING_FRAMES, _BREATHING_DELTAS)
+
+    def _ping_pong_frames(self) -> Generator[tuple[Packet, ...], None, None]:
+        return self._loop(_PING_PONG_FRAMES, _PING_PONG_DELTAS)
+
+    def _sparkle_frames(self) -> Generator[list[Packet], None, None]:
+        # Off packets for what is lit; the oldest is turned off as each new one pushes it out.
+        active: deque[Packet] = deque(maxlen=10)
+
+        def light(frame: list[Packet], off: Packet, on: Packet) -> None:
+            if len(active) == active.maxlen:
+                frame.append(active[0])
+            active.append(off)
+            frame.append(on)
+
+        # Walk the pads in a fresh shuffled order each round, drawing the
+        # button choices for the whole round at once.
+        rng = random.Random()
+        pads = list(_SPARKLE_PAD_PACKETS)
+        try:
+            while True:
+                rng.shuffle(pads)
+                buttons = rng.choices(_SPARKLE_BUTTON_PACKETS, k=len(pads))
+                lights_button = [rng.random() > 0.65 for _ in pads]
+                for pad, button, lit in zip(pads, buttons, lights_button):
+                    frame: list[Packet] = []
+                    light(frame, *pad)
+                    if lit:
+                        light(frame, *button)
+                    yield frame
+        finally:
+            self._send_bulk(tuple(active))
+
+    def _rainbow_chase_frames(self) -> Generator[tuple[Packet, ...], None, None]:
+        return self._loop(_RAINBOW_CHASE_FRAMES, _RAINBOW_CHASE_DELTAS)
@@ -6,7 +6,20 @@ incoming messages from the controller; output mappings are used to send LED
 commands back to it.
 """
 
-from typing import NamedTuple
+from typing import Callable, NamedTuple
+
+
+def _normalize_14bit(raw: int) -> float:
+    return raw / 16383.0
+
+
+def _normalize_bipolar_14bit(raw: int) -> float:
+    # Centre detent at 8192 maps to 0.0
+    return max(-1.0, min(1.0, (raw - 8192) / 8192.0))
+
+
+def _normalize_7bit(raw: int) -> float:
+    return raw / 127.0
 
 
 class ButtonInfo(NamedTuple):
@@ -20,6 +33,7 @@ class KnobInfo(NamedTuple):
     deck: int | None
     lsb_cc: int | None   # None for 7-bit absolute controls
     relative: bool        # True for encoders (browse)
+    normalize: Callable[[int], float] = _normalize_14bit  # raw -> event value
 
 
 class JogInfo(NamedTuple):
@@ -130,7 +144,7 @@ BUTTON_INPUT: dict[tuple[int, int], ButtonInfo] = {
 
 # (channel, msb_cc) -> KnobInfo  (14-bit control_change)
 KNOB_14BIT_INPUT: dict[tuple[int, int], KnobInfo] = {
-    (0, 0):  KnobInfo('TEMPO',           1,    32,   False),
+    (0, 0):  KnobInfo('TEMPO',           1,    32,   False, _normalize_bipolar_14bit),
     (0, 2):  KnobInfo('TRIM',            1,    34,   False),
     (0, 4):  KnobInfo('EQ_HI',          1,    36,   False),
     (0, 7):  KnobInfo('EQ_MID',         1,    39,   False),
@@ -138,7 +152,7 @@ KNOB_14BIT_INPUT: dict[tuple[int, int], KnobInfo] = {
     (0, 15): KnobInfo('CFX',            1,    47,   False),
     (0, 19): KnobInfo('CH_FADER',       1,    51,   False),
 
-    (1, 0):  KnobInfo('TEMPO',           2,    32,   False),
+    (1, 0):  KnobInfo('TEMPO',           2,    32,   False, _normalize_bipolar_14bit),
     (1, 2):  KnobInfo('TRIM',            2,    34,   False),
     (1, 4):  KnobInfo('EQ_HI',          2,    36,   False),
     (1, 7):  KnobInfo('EQ_MID',         2,    39,   False),
@@ -164,7 +178,7 @@ KNOB_14BIT_LSB: dict[tuple[int, int], tuple[int, int]] = {
 
 # 7-bit absolute (MONO_STEREO slider)
 KNOB_7BIT_INPUT: dict[tuple[int, int], KnobInfo] = {
-    (6, 109): KnobInfo('MONO_STEREO', None, None, False),
+    (6, 109): KnobInfo('MONO_STEREO', None, None, False, _normalize_7bit),
 }
 
 # Browse encoder (relative)
@@ -192,6 +206,19 @@ PAD_LED_MODES: dict[str, int] = {
     'KEY_SHIFT': 112,
 }
 
+# Flat pad LED table: index ((deck - 1) * 2 + shifted) * 64 + mode_index * 8 + pad
+# -> (channel, note), where mode_index follows the order of PAD_LED_MODES.
+PAD_LED_TABLE: tuple[tuple[int, int], ...] = tuple(
+    (PAD_LED_CHANNELS[deck][shifted], offset + pad)
+    for deck in (1, 2)
+    for shifted in (0, 1)
+    for offset in PAD_LED_MODES.values()
+    for pad in range(8)
+)
+
+# Tab LED notes by tab index (sent on channel 0 for deck 1, channel 1 for deck 2)
+TAB_LED_NOTES: tuple[int, ...] = (27, 30, 32, 34)
+
 # Button LED: (name, deck_or_none, shifted) -> (channel, note)
 # Derived from BUTTON_INPUT — the same MIDI address is used for both.
 BUTTON_LED: dict[tuple[str, int | None, bool], tuple[int, int]] = {